@@ -1 +1 @@
-from .observer import Observer, Observable
+from .observer import Observer, Observable, SerializedObservable, RingBufferedObservable
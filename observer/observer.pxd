@@ -0,0 +1,20 @@
+# cython: language_level=3
+#
+# Augmenting declarations for the optional Cython build of observer.py.
+# When setup.py is run with PYOBSERVER_ENABLE_SPEEDUPS=1 and Cython is
+# available, Observable is compiled as an extension type: attribute access
+# becomes a C struct field read and notify/notify_many get cpdef dispatch.
+# Pure Python subclasses (including SerializedObservable and
+# RingBufferedObservable) inherit the C layout for the declared fields.
+# The pure Python module is untouched otherwise.
+
+cdef class Observable:
+    cdef public str name
+    cdef public list _observers
+    cdef public set _observer_ids
+    cdef public tuple _observers_tuple
+    cdef public tuple _update_callbacks
+    cdef public object _compiled_notify
+
+    cpdef notify(self, new_state)
+    cpdef notify_many(self, states)
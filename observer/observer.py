@@ -2,9 +2,12 @@
 
 from abc import ABCMeta
 from abc import abstractmethod
+from collections import deque
+from itertools import count
+from threading import Lock
 
 
-class Observer(object):
+class Observer(metaclass=ABCMeta):
     """
     This abstract class represents the observer listening for updates from the Observable object
     (Subject).
@@ -17,29 +20,49 @@ class Observer(object):
         >>> from Observer import Observer
         >>> class NewValueSubscriber(Observer):
         ...     def __init__(self):
-        ...         super(NewValueSubscriber, self).__init__()
+        ...         super().__init__()
         ...         self._value = 0
         ...     def update(self, new_value):
-        ...         print('{} received new value: {}'.format(self._name, new_value[0]))
+        ...         print(f'{self.name} received new value: {new_value}')
     """
-    __metaclass__ = ABCMeta
+    __slots__ = ('name',)
 
-    _object_counter = 0
+    _object_counter = 0  # mirrors the count below for the object_counter property
+    _counter = count()  # a single C-level increment, atomic under the GIL
+    _name_prefix = 'Observer'
+    _registered = set()  # all subclasses, for the O(1) __subclasshook__ probe
 
     def __init__(self, name=None):
         """
         :param name: A name may be set for the subtyping class object for easy identification.
         if not set, the class name is used with a class object counter.
         """
-        self.name = name if name else self.__class__.__name__ + str(Observer._object_counter)
-        Observer._object_counter += 1
+        sequence = next(Observer._counter)
+        Observer._object_counter = sequence + 1
+        self.name = name or self._name_prefix + str(sequence)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._name_prefix = cls.__name__  # cache the name lookup per subclass
+        Observer._registered.add(cls)
+
+    @classmethod
+    def __subclasshook__(cls, sub_class):
+        # Single set probe for the common case. Only answer for Observer
+        # itself: the hook is inherited, and the shared registry must not
+        # decide checks against concrete subclasses. Anything else (e.g.
+        # classes added via ABCMeta.register) falls back to the default
+        # resolution.
+        if cls is Observer and sub_class in cls._registered:
+            return True
+        return NotImplemented
 
     @abstractmethod
-    def update(self, *new_state):
+    def update(self, new_state):
         """
         Called by the concrete Observable when data has changed passing its state.
-        :param new_state: The new state.
-        :type new_state: A tuple of arbitrary content.
+        :param new_state: The new state, passed through exactly as given to notify.
+                          Publishers with multi-value state pass a tuple explicitly.
         """
         pass
 
@@ -51,12 +74,8 @@ class Observer(object):
         """
         return Observer._object_counter
 
-    @classmethod
-    def __subclasshook__(cls, sub_class):  # correct behavior when isinstance, issubclass is called
-        return any(cls.update.__str__() in klazz.__dict__ for klazz in sub_class.__mro__) != []
-
 
-class Observable(object):
+class Observable:
     """
     This base class represents an observable (also known as a subject or publisher) with a one-to-many
     relationship with its registered observers.
@@ -66,7 +85,7 @@ class Observable(object):
         >>> from Observer import Observable
         >>> class NewDataPublisher(Observable):
         ...     def __init__(self):
-        ...         super(NewDataPublisher, self).__init__()
+        ...         super().__init__()
         ...         self._value = 0
         ...     @property
         ...     def value(self):
@@ -76,14 +95,25 @@ class Observable(object):
         ...         self._value = value
         ...         self.notify(value)  # We update immediately after changing the property
         ...
+
+    Note that subclasses declaring __slots__ themselves keep the full
+    memory and attribute-access win; subclasses without it simply get a
+    __dict__ again as usual.
     """
 
+    __slots__ = ('name', '_observers', '_observer_ids', '_observers_tuple',
+                 '_update_callbacks', '_compiled_notify')
+
     def __init__(self, name = None):
         """
         :param name: A name may be set for this class, but if not set the class name is used.
         """
-        self.name = name if name else self.__class__.__name__
-        self._observers = set()  # use a set to avoid duplicate registered observers
+        self.name = name or self.__class__.__name__
+        self._observers = []  # iterated in attach order; duplicates kept out via the id set
+        self._observer_ids = set()  # id()-keyed registry to avoid duplicate registered observers
+        self._observers_tuple = ()  # snapshot for fast iteration in notify
+        self._update_callbacks = ()  # bound update methods, parallel to the snapshot
+        self._compiled_notify = None  # straight-line notify built by compile_notify
 
     def attach(self, observer):
         """
@@ -93,10 +123,17 @@ class Observable(object):
         :param observer: The observer object to be attached.
         :type observer: Observer
         :raise ValueError is raised if the observer object is not of type Observer
+        :raise TypeError is raised if the observer class has not overridden update
         """
         if not isinstance(observer, Observer):
             raise ValueError('You need to pass a valid Observer class object')
-        self._observers.add(observer)
+        update = getattr(type(observer), 'update', None)
+        if update is None or update is Observer.update:  # fail here, not on every notify
+            raise TypeError('Observer subclass must override update')
+        if id(observer) not in self._observer_ids:
+            self._observer_ids.add(id(observer))
+            self._observers.append(observer)
+            self._rebuild_snapshots()
 
     def detach(self, observer):
         """
@@ -104,17 +141,218 @@ class Observable(object):
         :param observer: The observer object to be removed.
         :type observer: Observer
         """
-        if observer in self._observers:
-            self._observers.discard(observer)
+        if id(observer) in self._observer_ids:
+            self._observer_ids.remove(id(observer))  # membership just verified
+            self._observers = [existing for existing in self._observers
+                               if existing is not observer]
+            self._rebuild_snapshots()
+
+    def _rebuild_snapshots(self):
+        """Rebuilds the iteration snapshots after the observer set has changed."""
+        self._observers_tuple = tuple(self._observers)
+        self._update_callbacks = tuple(observer.update for observer in self._observers_tuple)
+        self._compiled_notify = None  # any specialized notify is now stale
+
+    def compile_notify(self):
+        """
+        Generates a specialized notify with the current observers' update calls
+        laid out straight-line, skipping the dispatch loop entirely. Worthwhile
+        for publishers whose observer set rarely changes. Observable.notify
+        uses the compiled form until attach or detach invalidates it; call
+        this again afterwards to re-specialize.
+        :return: the compiled notify function, also installed on this instance.
+        :raise TypeError is raised on subclasses overriding notify (such as
+               SerializedObservable and RingBufferedObservable), whose notify
+               would silently ignore the compiled form.
+        """
+        if type(self).notify is not Observable.notify:
+            raise TypeError('compile_notify is only supported when notify is '
+                            'not overridden')
+        callbacks = self._update_callbacks
+        names = ['update{}'.format(i) for i in range(len(callbacks))]
+        body = '; '.join('{}(new_state)'.format(n) for n in names) or 'pass'
+        namespace = dict(zip(names, callbacks))
+        exec('def _notify(new_state): {}'.format(body), namespace)
+        self._compiled_notify = namespace['_notify']
+        return self._compiled_notify
 
-    def notify(self, *new_state):
+    def notify(self, new_state):
         """
         The new state is updated to all registered Observers.
-        :param new_state: The new state.
-        :type new_state: A tuple of arbitrary content.
+        :param new_state: The new state, passed through to each observer as-is.
+                          Pass a tuple explicitly for multi-value state.
+        """
+        compiled = self._compiled_notify
+        if compiled is not None:
+            compiled(new_state)
+            return
+        callbacks = self._update_callbacks
+        if not callbacks:
+            return
+        for update in callbacks:
+            update(new_state)
+
+    def notify_many(self, states):
+        """
+        A whole batch of states is updated to all registered Observers,
+        amortizing the per-event dispatch overhead: each observer receives the
+        full batch before the next observer sees any of it. Publishers needing
+        per-state ordering across observers should call notify per state.
+        :param states: An iterable of states, each passed through to the
+                       observers exactly as notify would pass it.
+        """
+        callbacks = self._update_callbacks
+        if not callbacks:
+            return
+        if not isinstance(states, (tuple, list)):
+            states = tuple(states)  # the batch is iterated once per observer
+        for update in callbacks:
+            for new_state in states:
+                update(new_state)
+
+
+class SerializedObservable(Observable):
+    """
+    An Observable that serializes concurrent notify calls from multiple producer
+    threads, guaranteeing that observers never see two updates at once and that
+    states are delivered in enqueue order.
+
+    The first thread to call notify becomes the drain owner and dispatches
+    directly (the single-producer fast path); threads arriving while a drain is
+    in progress enqueue their state and return immediately. Observer update
+    implementations are never called under the lock.
+    """
+
+    __slots__ = ('_queue', '_wip', '_wip_lock')
+
+    def __init__(self, name = None):
+        """
+        :param name: A name may be set for this class, but if not set the class name is used.
+        """
+        super().__init__(name)
+        self._queue = deque()
+        self._wip = 0  # number of states accepted but not yet dispatched
+        self._wip_lock = Lock()
+
+    def notify(self, new_state):
+        """
+        The new state is updated to all registered Observers, serialized across
+        producer threads. If another thread is currently dispatching, the state
+        is queued and delivered by that thread before it returns.
+        If an observer's update raises, the queued backlog is still delivered
+        and the first error is re-raised to the draining producer afterwards,
+        so the stream keeps working for subsequent notify calls.
+        :param new_state: The new state, passed through to each observer as-is.
+                          Pass a tuple explicitly for multi-value state.
+        """
+        with self._wip_lock:
+            self._wip += 1
+            if self._wip > 1:  # another thread owns the drain loop
+                self._queue.append(new_state)
+                return
+        self._drain(new_state)
+
+    def notify_many(self, states):
+        """
+        A whole batch of states is updated to all registered Observers through
+        the serialized path: the batch is enqueued atomically, so its states
+        are delivered contiguously and never interleave with a concurrent
+        notify. Unlike Observable.notify_many, every observer receives each
+        state before any observer sees the next one, as notify would deliver.
+        :param states: An iterable of states, each passed through to the
+                       observers exactly as notify would pass it.
+        """
+        if not isinstance(states, (tuple, list)):
+            states = tuple(states)
+        if not states:
+            return
+        with self._wip_lock:
+            owner = not self._wip
+            self._wip += len(states)
+            if owner:  # this thread drains; its first state skips the queue
+                self._queue.extend(states[1:])
+            else:
+                self._queue.extend(states)
+        if owner:
+            self._drain(states[0])
+
+    def _drain(self, new_state):
+        """Dispatches new_state and then the queued backlog as the drain owner."""
+        error = None
+        try:
+            while True:
+                try:
+                    for update in self._update_callbacks:
+                        update(new_state)
+                except Exception as exc:
+                    if error is None:
+                        error = exc  # finish the backlog before re-raising
+                with self._wip_lock:
+                    self._wip -= 1
+                    if not self._wip:
+                        break
+                    new_state = self._queue.popleft()
+        except BaseException:  # e.g. KeyboardInterrupt: give up drain ownership
+            with self._wip_lock:
+                self._queue.clear()
+                self._wip = 0
+            raise
+        if error is not None:
+            raise error
+
+
+class RingBufferedObservable(Observable):
+    """
+    An Observable for sustained high-throughput publishing that writes each
+    state into a fixed, pre-allocated ring of slots indexed by a monotonic
+    sequence counter before dispatching, in the style of the LMAX Disruptor.
+
+    The ring itself is allocated once, so the hot path performs no per-event
+    container allocation; it also doubles as a window of the most recent
+    states, which late-attaching observers may inspect via last_states.
+    Slots are overwritten once the sequence wraps, so observers must not
+    retain references into the ring across more than capacity notifies.
+    """
+
+    __slots__ = ('_ring', '_mask', '_seq')
+
+    def __init__(self, capacity = 1024, name = None):
+        """
+        :param capacity: The number of pre-allocated ring slots. Must be a
+                         power of two so slot indexing is a single mask.
+        :param name: A name may be set for this class, but if not set the class name is used.
+        :raise ValueError is raised if capacity is not a positive power of two.
+        """
+        super().__init__(name)
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError('capacity must be a positive power of two')
+        self._ring = [None] * capacity
+        self._mask = capacity - 1
+        self._seq = 0
+
+    def notify(self, new_state):
+        """
+        The new state is written into the next ring slot and updated to all
+        registered Observers.
+        :param new_state: The new state, passed through to each observer as-is.
+                          Pass a tuple explicitly for multi-value state.
+        """
+        seq = self._seq
+        self._ring[seq & self._mask] = new_state
+        self._seq = seq + 1
+        for update in self._update_callbacks:
+            update(new_state)
+
+    def last_states(self, count = 1):
+        """
+        Returns the most recently published states, oldest first.
+        :param count: The number of states wanted; capped by the ring capacity
+                      and by how many states have been published so far.
+        :return: a list of at most count states.
         """
-        for observer in self._observers:
-            observer.update(new_state)
+        seq = self._seq
+        count = min(count, seq, self._mask + 1)
+        return [self._ring[i & self._mask] for i in range(seq - count, seq)]
 
 
 if __name__ == "__main__":
@@ -126,15 +364,15 @@ if __name__ == "__main__":
     """
     class NewValueSubscriber(Observer):
         def __init__(self):
-            super(NewValueSubscriber, self).__init__()
+            super().__init__()
 
         def update(self, new_value):
-            print('{} received new value: {}'.format(self.name, new_value[0]))
+            print(f'{self.name} received new value: {new_value}')
 
 
     class NewValuePublisher(Observable):
         def __init__(self):
-            super(NewValuePublisher, self).__init__()
+            super().__init__()
             self._value = 0
 
         @property
@@ -144,9 +382,9 @@ if __name__ == "__main__":
         @value.setter
         def value(self, value):
             self._value = value
-            print('New value: {}'.format(value))
+            print(f'New value: {value}')
             if self._observers:
-                print('{} updating new value: {} to observers'.format(self.name, value))
+                print(f'{self.name} updating new value: {value} to observers')
             self.notify(value)  # using a property for updating value and subscribers/observers
 
     publisher = NewValuePublisher()
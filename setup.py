@@ -1,5 +1,19 @@
+import os
+
 from setuptools import setup
 
+# Optional Cython compilation of the hot dispatch path. Enabled explicitly
+# via PYOBSERVER_ENABLE_SPEEDUPS=1; falls back to pure Python if Cython is
+# not installed. Typed declarations live in observer/observer.pxd.
+ext_modules = []
+if os.environ.get('PYOBSERVER_ENABLE_SPEEDUPS') == '1':
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(['observer/observer.py'])
+
 setup(
     name = 'py-observer',
     version = '1.0.0',
@@ -8,5 +22,8 @@ setup(
     author_email = 'frederik.bjorne@gmail.com',
     description = 'Observer pattern implementation',
     packages = ['observer'],
+    python_requires = '>=3.6',
+    package_data = {'observer': ['*.pxd']},
+    ext_modules = ext_modules,
     license = 'MIT'
 )